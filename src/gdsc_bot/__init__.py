@@ -1,10 +1,42 @@
 from datetime import datetime
 from typing import Any, Optional, Union
+from weakref import WeakKeyDictionary
 
 import discord
 from discord import Color
 from discord.types.embed import EmbedType
 
+_TEAL = Color.dark_teal()
+_GREEN = Color.green()
+_RED = Color.red()
+
+# Thumbnail of the white tick mark emoji
+SUCCESS_THUMBNAIL_URL = (
+    "https://em-content.zobj.net/source/twitter/408/check-mark-button_2705.png"
+)
+# Thumbnail of the cross mark emoji
+ERROR_THUMBNAIL_URL = (
+    "https://em-content.zobj.net/source/twitter/408/cross-mark_274c.png"
+)
+
+# Marks that no timestamp was passed in, so `None` can still be used to send an
+# embed without any timestamp
+_UNSET: Any = object()
+
+# Cache of `(display_name, avatar_url)` per bot, so we don't have to walk the
+# `bot.user` properties every time an embed is built
+_BOT_META: WeakKeyDictionary[discord.Client, tuple[str, str]] = WeakKeyDictionary()
+
+
+def _meta(bot: discord.Client) -> tuple[str, str]:
+    """Gets the bot's display name and avatar url, computing them on the first call"""
+    meta = _BOT_META.get(bot)
+    if meta is None:
+        assert bot.user
+        meta = (bot.user.display_name, bot.user.display_avatar.url)
+        _BOT_META[bot] = meta
+    return meta
+
 
 class GDSCEmbed(discord.Embed):
     """Subclass `discord.Embed` so we don't have to repeat the same parameters again and again
@@ -12,19 +44,22 @@ class GDSCEmbed(discord.Embed):
     Defines the regular embeds that the bot sends
     """
 
+    # `discord.Embed` uses slots, keep it that way so instances don't get a `__dict__`
+    __slots__ = ()
+
     def __init__(
         self,
         bot: discord.Client,
         *,
-        color: Optional[Union[int, Color]] = Color.dark_teal(),
+        color: Optional[Union[int, Color]] = _TEAL,
         title: Optional[Any] = None,
         type: EmbedType = "rich",
         url: Optional[Any] = None,
         description: Optional[Any] = None,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[datetime] = _UNSET,
     ):
-        if timestamp is None:
-            timestamp = datetime.now()
+        if timestamp is _UNSET:
+            timestamp = discord.utils.utcnow()
         super().__init__(
             color=color,
             title=title,
@@ -33,29 +68,29 @@ class GDSCEmbed(discord.Embed):
             description=description,
             timestamp=timestamp,
         )
-        assert bot.user
-        self.set_thumbnail(url=bot.user.display_avatar.url)
-        self.set_author(
-            name=bot.user.display_name, icon_url=bot.user.display_avatar.url
-        )
+        name, avatar_url = _meta(bot)
+        self.set_thumbnail(url=avatar_url)
+        self.set_author(name=name, icon_url=avatar_url)
 
 
 class SuccessEmbed(discord.Embed):
     """Defines the 'success embeds' that the bot sends when any action is successful"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         bot: discord.Client,
         *,
-        color: Optional[Union[int, Color]] = Color.green(),
+        color: Optional[Union[int, Color]] = _GREEN,
         title: Optional[Any] = "Success",
         type: EmbedType = "rich",
         url: Optional[Any] = None,
         description: Optional[Any] = None,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[datetime] = _UNSET,
     ):
-        if timestamp is None:
-            timestamp = datetime.now()
+        if timestamp is _UNSET:
+            timestamp = discord.utils.utcnow()
         super().__init__(
             color=color,
             title=title,
@@ -64,32 +99,29 @@ class SuccessEmbed(discord.Embed):
             description=description,
             timestamp=timestamp,
         )
-        assert bot.user
-        # Thumbnail of the white tick mark emoji
-        self.set_thumbnail(
-            url="https://em-content.zobj.net/source/twitter/408/check-mark-button_2705.png"
-        )
-        self.set_author(
-            name=bot.user.display_name, icon_url=bot.user.display_avatar.url
-        )
+        name, avatar_url = _meta(bot)
+        self.set_thumbnail(url=SUCCESS_THUMBNAIL_URL)
+        self.set_author(name=name, icon_url=avatar_url)
 
 
 class ErrorEmbed(discord.Embed):
     """Defines the 'error embeds' that the bot sends when any action is failed"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         bot: discord.Client,
         *,
-        color: Optional[Union[int, Color]] = Color.red(),
+        color: Optional[Union[int, Color]] = _RED,
         title: Optional[Any] = "Error",
         type: EmbedType = "rich",
         url: Optional[Any] = None,
         description: Optional[Any] = None,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[datetime] = _UNSET,
     ):
-        if timestamp is None:
-            timestamp = datetime.now()
+        if timestamp is _UNSET:
+            timestamp = discord.utils.utcnow()
         super().__init__(
             color=color,
             title=title,
@@ -98,11 +130,6 @@ class ErrorEmbed(discord.Embed):
             description=description,
             timestamp=timestamp,
         )
-        assert bot.user
-        # Thumbnail of the cross mark emoji
-        self.set_thumbnail(
-            url="https://em-content.zobj.net/source/twitter/408/cross-mark_274c.png"
-        )
-        self.set_author(
-            name=bot.user.display_name, icon_url=bot.user.display_avatar.url
-        )
+        name, avatar_url = _meta(bot)
+        self.set_thumbnail(url=ERROR_THUMBNAIL_URL)
+        self.set_author(name=name, icon_url=avatar_url)
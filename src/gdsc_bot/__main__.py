@@ -1,18 +1,20 @@
+import asyncio
 import os
 import sys
+from io import BytesIO
 from pathlib import Path
 from typing import Final
 
-from aiohttp import ClientSession
-from discord import File, Game, Intents, Member
+from aiohttp import ClientSession, TCPConnector
+from discord import AllowedMentions, File, Game, Intents, Member, utils
 from discord.ext import commands
 from dotenv import load_dotenv
-from easy_pil import Editor, Font, load_image_async
 
 # Loguru will enable us to log things, good for debugging
 # Could have used default python logger also but this is easier to setup
 # and I wanted to try it
 from loguru import logger
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 # Load environment variables
 # Stores private information soch as the `TOKEN` and the `GEMINI_API_KEY`
@@ -26,53 +28,131 @@ if not token:
 TOKEN: Final[str] = token
 logger.debug("Token read successfully")
 
+# If the user has a proxy, then use that for future networking operations
+PROXY: Final = os.getenv("http_proxy")
+
+# Intents lets us select what data we want discord to send to the bot
+# Built once at import, instead of every time a `Client` is made
+INTENTS: Final = Intents.default()
+INTENTS.message_content = True
+INTENTS.members = True
+INTENTS.guilds = True
+INTENTS.guild_messages = True
+
+
+AVATAR_SIZE = (150, 150)
+AVATAR_POSITION = (325, 90)
+
+# The avatar is always resized to the same size, so the circular mask can be built once
+_AVATAR_MASK = Image.new("L", AVATAR_SIZE, 0)
+ImageDraw.Draw(_AVATAR_MASK).ellipse((0, 0, *AVATAR_SIZE), fill=255)
+
+
+def _render_welcome(
+    background: Image.Image,
+    avatar_image: Image.Image,
+    guild_name: str,
+    member_name: str,
+    font: ImageFont.FreeTypeFont,
+    small_font: ImageFont.FreeTypeFont,
+) -> BytesIO:
+    """Draws the member's avatar and name on the welcome card background, runs in a worker thread
+
+    Uses PIL directly, so the whole card is drawn on the one background image without any intermediate copies
+    """
+    avatar = avatar_image.convert("RGBA").resize(AVATAR_SIZE, Image.Resampling.LANCZOS)
+    # Keep the avatar's own transparency inside the circle, so the background shows through it
+    mask = ImageChops.multiply(_AVATAR_MASK, avatar.getchannel("A"))
+    background.paste(avatar, AVATAR_POSITION, mask)
+
+    x, y = AVATAR_POSITION
+    draw = ImageDraw.Draw(background)
+    draw.ellipse(
+        (x, y, x + AVATAR_SIZE[0], y + AVATAR_SIZE[1]), outline="white", width=5
+    )
+
+    # The "mt" anchor centers the text horizontally on the given position
+    draw.text(
+        (400, 260), f"Welcome to {guild_name}", fill="white", font=font, anchor="mt"
+    )
+    draw.text((400, 325), member_name, fill="white", font=small_font, anchor="mt")
+
+    image_bytes = BytesIO()
+    background.save(image_bytes, "JPEG", quality=85)
+    image_bytes.seek(0)
+    return image_bytes
+
 
 class Client(commands.Bot):
     def __init__(self) -> None:
-        # If the user has a proxy, then use that for future networking operations
-        proxy = os.getenv("http_proxy")
-        self.proxy = proxy
+        self.proxy = PROXY
+
+        if PROXY:
+            logger.debug(f"Using proxy settings: {PROXY}")
+
+        super().__init__(command_prefix=".", intents=INTENTS, proxy=PROXY)
+
+        # The welcome card fonts, loaded on the first member join
+        self._fonts: tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont] | None = None
 
-        if proxy:
-            logger.debug(f"Using proxy settings: {proxy}")
+    def _welcome_fonts(self) -> tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
+        """Loads the welcome card fonts the first time they're needed, and reuses them after that"""
+        if self._fonts is None:
+            # `easy_pil` is only needed for the welcome card, so don't import it until someone joins
+            from easy_pil import Font
 
-        # Intents lets us select what data we want discord to send to the bot
-        intents = Intents.default()
-        intents.message_content = True
-        intents.members = True
-        intents.guilds = True
-        intents.guild_messages = True
-        super().__init__(command_prefix=".", intents=intents, proxy=proxy)
+            self._fonts = (
+                Font.poppins(size=50, variant="bold"),
+                Font.poppins(size=20, variant="bold"),
+            )
+        return self._fonts
 
     async def on_ready(self) -> None:
         """Hook activates when the bot has finished logging into discord and is ready"""
         # Set the rich presence thing, so it shows "Playing /help", so that the users can see the help command quickly
         await self.change_presence(activity=Game("/help"))
-
-        # Set the `aiohttp` client to use our proxy settings
-        self.client = ClientSession(proxy=self.proxy)
         logger.info(f"{self.user} is now running!")
 
-    async def on_shutdown(self) -> None:
+    async def close(self) -> None:
+        """Hook activates when the bot is shutting down"""
         logger.info("Goodbye!")
-        # Remember to close the `aiohttp` client
-        await self.client.close()
+        # Remember to close the `aiohttp` client, it may not exist if we never got to `setup_hook`
+        if hasattr(self, "client") and not self.client.closed:
+            await self.client.close()
+        await super().close()
 
     async def setup_hook(self) -> None:
         """Load commands from the 'commands' folder during setup"""
 
+        # Set the `aiohttp` client to use our proxy settings
+        # Created here instead of `on_ready`, as `on_ready` fires again on every reconnect
+        self.client = ClientSession(
+            proxy=self.proxy, connector=TCPConnector(limit=100, ttl_dns_cache=300)
+        )
+
+        # Decode the welcome card background once, instead of on every member join
+        self.background_template = Image.open("assets/background.jpg").convert("RGB")
+
         # Walk through every command file in the commands directory (python files) and load them as an extension.
         # So we don't have to manually import the commands
         current_file_path = Path(__file__).resolve()
         commands_dir = current_file_path.parent / "commands"
 
-        for filename in commands_dir.iterdir():
-            if filename.name.endswith(".py") and filename.name != "__init__.py":
-                try:
-                    await self.load_extension(f"gdsc_bot.commands.{filename.stem}")
-                    logger.info(f"Loaded command: {filename}")
-                except Exception as e:
-                    logger.error(f"Failed to load command {filename}: {e}")
+        # `[!_]` skips `__init__.py`, and any other private module
+        extensions = [
+            f"gdsc_bot.commands.{path.stem}" for path in commands_dir.glob("[!_]*.py")
+        ]
+
+        # Load all the extensions concurrently, a failing one shouldn't stop the others from loading
+        results = await asyncio.gather(
+            *(self.load_extension(extension) for extension in extensions),
+            return_exceptions=True,
+        )
+        for extension, result in zip(extensions, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to load command {extension}: {result}")
+            else:
+                logger.info(f"Loaded command: {extension}")
 
         try:
             # Sync the slash commands with discord globally
@@ -83,7 +163,7 @@ class Client(commands.Bot):
             logger.error(f"Error syncing commands: {e}")
 
     async def on_member_join(self, member: Member) -> None:
-        """Send a welcome card to the user, use `easy_pil` to edit the background image"""
+        """Send a welcome card to the user, use `PIL` to draw on the background image"""
         if member.bot:
             return
 
@@ -93,42 +173,60 @@ class Client(commands.Bot):
             return
         logger.debug(f"New user joined: {member.id} on {member.guild.name}")
 
-        background = Editor("assets/background.jpg")
-        avatar_image = await load_image_async(member.display_avatar.url, self.client)
-
-        avatar = Editor(avatar_image).resize((150, 150)).circle_image()
-        poppins = Font.poppins(size=50, variant="bold")
-        poppins_small = Font.poppins(size=20, variant="bold")
-        background.paste(avatar, (325, 90))
-        background.ellipse((325, 90), 150, 150, outline="white", stroke_width=5)
-
-        background.text(
-            (400, 260),
-            f"Welcome to {member.guild.name}",
-            color="white",
-            font=poppins,
-            align="center",
+        # Only imported on the first member join, after that it's just a lookup in `sys.modules`
+        from easy_pil import load_image_async
+
+        # Start downloading the avatar, and copy the background while it's in flight
+        avatar_task = asyncio.create_task(
+            load_image_async(member.display_avatar.url, self.client)
         )
-        background.text(
-            (400, 325),
-            f"{member.name}",
-            color="white",
-            font=poppins_small,
-            align="center",
+        background = self.background_template.copy()
+        font, small_font = self._welcome_fonts()
+        avatar_image = await avatar_task
+
+        # The compositing is all blocking PIL work, so keep it off the event loop
+        image_bytes = await asyncio.to_thread(
+            _render_welcome,
+            background,
+            avatar_image,
+            member.guild.name,
+            member.name,
+            font,
+            small_font,
         )
+        file = File(fp=image_bytes, filename="welcome.jpg")
 
-        file = File(fp=background.image_bytes, filename="welcome.jpg")
-
+        # Send the greeting and the card in one request, and only ping the new member
         await channel.send(
-            f"Hello {member.mention}! Welcome To **{member.guild.name}**"
+            content=f"Hello {member.mention}! Welcome To **{member.guild.name}**",
+            file=file,
+            allowed_mentions=AllowedMentions(everyone=False, users=True, roles=False),
         )
-        await channel.send(file=file)
 
 
 def main() -> None:
     """Initialize and run the bot."""
     client = Client()
-    client.run(TOKEN)
+
+    # uvloop is optional, if it's installed use it as it's a faster event loop than asyncio's default one
+    try:
+        import uvloop
+    except ImportError:
+        client.run(TOKEN)
+        return
+
+    # Same as `client.run`, except it runs on uvloop
+    utils.setup_logging(root=False)
+
+    async def runner() -> None:
+        async with client:
+            await client.start(TOKEN)
+
+    try:
+        uvloop.run(runner())
+    except KeyboardInterrupt:
+        # Nothing to do here, `async with` already closed the client
+        pass
 
 
 if __name__ == "__main__":
@@ -1,11 +1,14 @@
-from collections import defaultdict
-import os
+from collections import defaultdict, deque
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 from google import genai
+from google.genai import types
 from loguru import logger
 
+from gdsc_bot.util import GEMINI_API_KEY, send_streamed
+
 
 class AIGroup(commands.GroupCog, group_name="ai"):  # type: ignore[call-arg]
     """
@@ -13,19 +16,15 @@ class AIGroup(commands.GroupCog, group_name="ai"):  # type: ignore[call-arg]
     """
 
     def __init__(self, bot: commands.Bot):
-        # Load the API key
-        genai_key = os.getenv("GEMINI_API_KEY")
-
-        if not genai_key:
-            logger.error("Unable to load Gemini API key")
-
         # Create Gemini client
-        self.genai_client = genai.Client(api_key=genai_key)
+        self.genai_client = genai.Client(api_key=GEMINI_API_KEY)
         self.bot = bot
 
-        # Store conversation history: {user_id: [(role, message), ...]}
-        self.conversations: defaultdict[int, list[tuple[str, str]]]
-        self.conversations = defaultdict(list)
+        # Store conversation history: {user_id: deque([(role, message), ...])}
+        # Keep only the last 10 exchanges (user + assistant) to avoid excessive memory usage,
+        # the deque drops the oldest messages by itself
+        self.conversations: defaultdict[int, deque[tuple[str, str]]]
+        self.conversations = defaultdict(lambda: deque(maxlen=20))
 
     @app_commands.command(
         name="respond", description="Chat using Gemini API with memory!"
@@ -39,52 +38,27 @@ class AIGroup(commands.GroupCog, group_name="ai"):  # type: ignore[call-arg]
         # Append user message to history
         self.conversations[user_id].append(("user", prompt))
 
-        # Keep only the last 10 exchanges to avoid excessive memory usage
-        self.conversations[user_id] = self.conversations[user_id][-10:]
-
         try:
-            # Construct conversation context for the API
-            conversation_history = "\n".join(
-                [f"{role}: {message}" for role, message in self.conversations[user_id]]
-            )
+            # Send the history in Gemini's native multi-turn format,
+            # instead of flattening it into one big string on every call
+            conversation_history: list[types.ContentUnion] = [
+                types.Content(role=role, parts=[types.Part(text=message)])
+                for role, message in self.conversations[user_id]
+            ]
 
             # Call the Gemini API with chat history
-            response = self.genai_client.models.generate_content(
+            # Stream the response with the async client, so the event loop keeps running
+            # and the first messages go out while Gemini is still writing the rest
+            stream = await self.genai_client.aio.models.generate_content_stream(
                 model="gemini-2.0-flash", contents=conversation_history
             )
 
-            if not response:
-                await interaction.followup.send("No response")
-                return
-
-            text = response.text
-            if not text:
-                logger.debug("No response from Gemini")
+            chunks = await send_streamed(interaction, stream)
+            if not chunks:
                 return
 
             # Append bot response to conversation history
-            self.conversations[user_id].append(("assistant", text))
-
-            # Ensure Discord message fits within 2000 characters
-            if len(text) <= 2000:
-                await interaction.followup.send(text)
-            else:
-                # Split into multiple messages
-                chunks = []
-                current_chunk = ""
-
-                for line in text.splitlines():
-                    if len(current_chunk) + len(line) + 1 > 2000:
-                        chunks.append(current_chunk)
-                        current_chunk = line  # Start a new chunk
-                    else:
-                        current_chunk += ("\n" + line) if current_chunk else line
-
-                if current_chunk:
-                    chunks.append(current_chunk)
-
-                for chunk in chunks:
-                    await interaction.followup.send(chunk)
+            self.conversations[user_id].append(("model", "\n".join(chunks)))
 
             logger.info(f"User {interaction.user} used /respond with prompt: {prompt}")
 
@@ -10,12 +10,12 @@ class HelpCommand(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    @app_commands.command(
-        name="help",
-        description="Shows a list of available commands and their descriptions.",
-    )
-    async def help(self, interaction: discord.Interaction) -> None:
-        assert self.bot.user
+        # The command tree only changes while the extensions are being loaded,
+        # so the help embed is built lazily on the first `/help` and reused after that
+        self._help_embed: GDSCEmbed | None = None
+
+    def _build_embed(self) -> GDSCEmbed:
+        """Walks the command tree and adds the command descriptions to the embed, grouped by their group"""
         embed = GDSCEmbed(
             self.bot,
             title="Bot Help Menu",
@@ -41,7 +41,19 @@ class HelpCommand(commands.Cog):
         for group, commands_list in command_groups.items():
             embed.add_field(name=group, value="\n".join(commands_list))
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return embed
+
+    @app_commands.command(
+        name="help",
+        description="Shows a list of available commands and their descriptions.",
+    )
+    async def help(self, interaction: discord.Interaction) -> None:
+        if self._help_embed is None:
+            self._help_embed = self._build_embed()
+
+        # Only the timestamp changes between invocations
+        self._help_embed.timestamp = discord.utils.utcnow()
+        await interaction.response.send_message(embed=self._help_embed, ephemeral=True)
         logger.info(f"User {interaction.user} used /help")
 
 
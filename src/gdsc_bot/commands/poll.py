@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 
 import discord
@@ -68,62 +69,61 @@ class PollCommand(commands.Cog):
 
         valid_choices = [choice for choice in choices if choice]
 
+        # Pair up every choice with its emoji once, and reuse it everywhere below
+        pairs = list(zip(emojis, valid_choices))
+
         # Prepare the poll embed
-        description = "\n".join(
-            [f"{emojis[i]} {choice}" for i, choice in enumerate(valid_choices)]
-        )
+        description = "\n".join(f"{emoji} {choice}" for emoji, choice in pairs)
+
+        # Both the poll and the results have the same footer, so only build it once
+        footer_text = f"Poll by {interaction.user.name}"
+        footer_icon_url = interaction.user.display_avatar.url
 
         # Send the inital poll message with the polls
         poll_embed = GDSCEmbed(
             self.bot, title=title, description=description
-        ).set_footer(
-            text=f"Poll by {interaction.user.name}",
-            icon_url=interaction.user.display_avatar.url,
-        )
-        await interaction.response.send_message(embed=poll_embed)
-
-        # Fetch the sent message to add the reaction buttons
-        fetched_msg = await interaction.original_response()
+        ).set_footer(text=footer_text, icon_url=footer_icon_url)
+        callback = await interaction.response.send_message(embed=poll_embed)
 
-        # Add reaction buttons
-        for i in range(len(valid_choices)):
-            await fetched_msg.add_reaction(emojis[i])
+        # The callback already has the sent message, so we don't have to fetch it to add the reaction buttons
+        fetched_msg = callback.resource
+        assert isinstance(fetched_msg, discord.InteractionMessage)
 
-        await fetched_msg.add_reaction("✅")
+        async def add_reaction(emoji: str) -> None:
+            # A single failed reaction shouldn't stop the rest of the buttons from being added
+            try:
+                await fetched_msg.add_reaction(emoji)
+            except discord.HTTPException as e:
+                logger.error(f"Failed to add reaction {emoji} to the poll: {e}")
 
-        # Used for the percentage calculation later
-        total_reactions = 0
+        # Add reaction buttons, all at once instead of waiting for each one
+        reaction_emojis = [emoji for emoji, _ in pairs] + ["✅"]
+        await asyncio.gather(*(add_reaction(emoji) for emoji in reaction_emojis))
 
         def check_if_the_author_reacted_with_tick(
             reaction: discord.Reaction, user: discord.Member
         ) -> bool:
-            nonlocal total_reactions
             if reaction.message.id != fetched_msg.id:
                 return False
 
-            if str(reaction.emoji) in emojis:
-                total_reactions += 1
-
             return str(reaction.emoji) == "✅" and user == interaction.user
 
-        await self.bot.wait_for(
+        tick_reaction, _ = await self.bot.wait_for(
             "reaction_add", check=check_if_the_author_reacted_with_tick
         )
 
-        # Fetch updated message to get reaction counts
-        channel = interaction.channel
-        assert channel
-        fetched_msg = await channel.fetch_message(fetched_msg.id)
-
-        # Subtract one as we don't want to count the bot's own reaction.
-        counts = [
-            (valid_choices[i], reaction.count - 1)
-            for i, reaction in enumerate(fetched_msg.reactions)
-            if reaction.emoji in emojis
-        ]
+        # `reaction.message` is the bot's cached copy of the poll, which discord.py keeps
+        # updated on every reaction add and remove. So there's no need to fetch the message again.
+        # Don't count the bot's own reaction, but only if it's there, adding it may have failed.
+        # Match the reactions by emoji, as they were added concurrently and may not be in order
+        reaction_counts = {
+            str(reaction.emoji): reaction.count - reaction.me
+            for reaction in tick_reaction.message.reactions
+        }
+        counts = [(choice, reaction_counts.get(emoji, 0)) for emoji, choice in pairs]
 
-        # Ensures that we're not dividing by zero
-        total_reactions = max(1, total_reactions)
+        # Used for the percentage calculation, ensures that we're not dividing by zero
+        total_reactions = max(1, sum(count for _, count in counts))
 
         result = "\n".join(
             [
@@ -137,10 +137,7 @@ class PollCommand(commands.Cog):
             title="Poll results",
             url=fetched_msg.jump_url,
             description=result,
-        ).set_footer(
-            text=f"Poll by {interaction.user.name}",
-            icon_url=interaction.user.display_avatar.url,
-        )
+        ).set_footer(text=footer_text, icon_url=footer_icon_url)
 
         await interaction.followup.send(embed=result_embed)
 
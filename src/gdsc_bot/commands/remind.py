@@ -1,15 +1,22 @@
 import asyncio
+import bisect
+import heapq
+import os
+import sqlite3
+import time
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, cast
+from itertools import count, groupby, islice
+from operator import itemgetter
+from typing import Final, Iterable, Optional
 
 import discord
 from discord import Member, User, app_commands
 from discord.ext import commands
 from loguru import logger
-from rapidfuzz import process
-from sortedcontainers import SortedSet
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 from gdsc_bot import ErrorEmbed, GDSCEmbed, SuccessEmbed
 
@@ -23,18 +30,138 @@ class PastDateTimeError(Exception):
 
 
 # Order makes it comparable by `dt`, frozen makes it immutable and thus making it hashable
-@dataclass(order=True, frozen=True)
+# Slots drop the per instance `__dict__`, making every reminder smaller and its attributes faster to read
+@dataclass(order=True, frozen=True, slots=True)
 class Reminder:
     dt: datetime
     message: str
 
+    # Derived from `dt` and `message` once when the reminder is made, instead of on every use
+    # POSIX timestamp of `dt`, the scheduler compares it against `time.time()`
+    timestamp: float = field(init=False, repr=False, compare=False)
+    # `dt` formatted for displaying, the autocomplete needs it on every keystroke
+    formatted_dt: str = field(init=False, repr=False, compare=False)
+    # The normalized (lowercased, stripped) text that the autocomplete fuzzy searches
+    search_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The dataclass is frozen, so go around its `__setattr__`
+        formatted_dt = self.dt.strftime(DATE_TIME_FORMAT)
+        object.__setattr__(self, "timestamp", self.dt.timestamp())
+        object.__setattr__(self, "formatted_dt", formatted_dt)
+        object.__setattr__(
+            self, "search_key", default_process(f"{self.message}: {formatted_dt}")
+        )
+
 
 DATE_TIME_FORMAT = (
     "%B %d, %I:%M %p"  # <month> <date>, <12-hours hour>:<minutes> <AM/PM>
 )
 DATE_FORMAT = "%d-%m-%Y"  # <date>-<month>-<year>
 TIME_FORMAT = "%I:%M %p"  # <12-hours hour>:<minutes> <AM/PM>
-CHECKING_FREQUENCY = 3
+# Maximum number of seconds to sleep between checks, so we don't drift too far if the system clock changes
+MAX_CHECKING_INTERVAL = 60
+# Number of reminders the autocomplete suggests for a search
+AUTOCOMPLETE_MATCHES = 5
+# Discord only shows this many autocomplete choices, building any more is wasted work
+MAX_AUTOCOMPLETE_CHOICES = 25
+# Reminders scoring lower than this (out of 100) aren't shown in the autocomplete, lets rapidfuzz stop scoring them early
+AUTOCOMPLETE_SCORE_CUTOFF = 60
+# Users only have a handful of reminders, scoring them inline is far cheaper than handing them to a thread.
+# Only past this many reminders is it worth moving the search off the event loop
+AUTOCOMPLETE_THREAD_THRESHOLD = 2000
+# SQLite database the reminders are saved to, so they survive bot restarts
+REMINDERS_DB: Final = os.getenv("REMINDERS_DB", "reminders.db")
+
+
+def _is_number(part: str, max_digits: int) -> bool:
+    """Checks that the part is 1 to `max_digits` ASCII digits, as `isdigit` also accepts digits like "٩" and "²" that `int` may not parse"""
+    return part.isascii() and part.isdigit() and len(part) <= max_digits
+
+
+# `strptime` goes through its whole locale aware parser on every call,
+# our formats are fixed and tiny so parsing them by hand is a lot faster
+def parse_time(time: str) -> tuple[int, int]:
+    """Parses a `TIME_FORMAT` string into a 24-hour `(hour, minute)`, raises a ValueError if it's invalid"""
+    clock, _, period = time.strip().rpartition(" ")
+    hour, _, minute = clock.strip().partition(":")
+    period = period.upper()
+
+    if not (_is_number(hour, 2) and _is_number(minute, 2) and period in ("AM", "PM")):
+        raise ValueError(f"'{time}' doesn't match the format HH:MM AM/PM")
+    if not (1 <= int(hour) <= 12 and 0 <= int(minute) <= 59):
+        raise ValueError(f"'{time}' isn't a valid time")
+
+    return int(hour) % 12 + (12 if period == "PM" else 0), int(minute)
+
+
+def parse_date(day: str) -> datetime:
+    """Parses a `DATE_FORMAT` string into a datetime at midnight, raises a ValueError if it's invalid"""
+    parts = day.strip().split("-")
+
+    if (
+        len(parts) != 3
+        or not (_is_number(parts[0], 2) and _is_number(parts[1], 2))
+        or not (_is_number(parts[2], 4) and len(parts[2]) == 4)
+    ):
+        raise ValueError(f"'{day}' doesn't match the format DD-MM-YYYY")
+
+    # `datetime` checks that the day and month are in range
+    return datetime(int(parts[2]), int(parts[1]), int(parts[0]))
+
+
+class ReminderStore:
+    """Keeps a copy of every reminder in SQLite, the `ReminderManager` writes through to it on every change"""
+
+    def __init__(self, path: str) -> None:
+        self.connection = sqlite3.connect(path)
+        # With WAL and `synchronous=NORMAL` a write is a cheap append instead of a full sync of the database
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS reminders (user_id INTEGER NOT NULL, dt REAL NOT NULL, message TEXT NOT NULL)"
+            )
+
+    def load(self) -> dict[int, list[Reminder]]:
+        """
+        Loads every reminder, grouped by the user's ID.
+
+        The rows come out in the same order `Reminder`s sort in, so each user's list is already sorted.
+        """
+        rows = self.connection.execute(
+            "SELECT user_id, dt, message FROM reminders ORDER BY user_id, dt, message"
+        )
+        return {
+            user_id: [
+                Reminder(datetime.fromtimestamp(dt), message)
+                for _, dt, message in group
+            ]
+            for user_id, group in groupby(rows, key=itemgetter(0))
+        }
+
+    def add(self, user_id: int, reminder: Reminder) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO reminders VALUES (?, ?, ?)",
+                (user_id, reminder.timestamp, reminder.message),
+            )
+
+    def remove(self, user_id: int, reminder: Reminder) -> None:
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM reminders WHERE user_id = ? AND dt = ? AND message = ?",
+                (user_id, reminder.timestamp, reminder.message),
+            )
+
+    def remove_user(self, user_id: int) -> None:
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM reminders WHERE user_id = ?", (user_id,)
+            )
+
+    def close(self) -> None:
+        self.connection.close()
 
 
 class ReminderManager:
@@ -42,28 +169,59 @@ class ReminderManager:
 
     Makes it easy for us to switch to another algorithm later on based on performance needs without affecting the upstream coed"""
 
-    def __init__(self) -> None:
+    def __init__(self, store: ReminderStore | None = None) -> None:
         """
-        Use a defaultdict[User | Memeber, SortedList[Reminder]] as the underlying backend of the manager.
+        Use a defaultdict[int, list[Reminder]] keyed by the user's ID as the underlying backend of the manager, each list is kept sorted with `bisect`.
+        The ID is cheaper to hash than the `User`/`Member` object, and is the same for every object we get for a user across interactions.
 
-        This currently looks the best for implementing this class. As it's performance characteristics are quite good and it naturally groups reminders per user. So there's no chance of reminder leakage form one user to another.
+        This currently looks the best for implementing this class. As it naturally groups reminders per user. So there's no chance of reminder leakage form one user to another.
+        Users only have a handful of reminders, and at that size a plain list beats `SortedList`/`SortedSet`, as the list operations are all done in C.
+
+        Alongside it keep a global min-heap of every reminder ordered by `dt`, so finding the expired reminders doesn't need to look at every user.
+        Deleted and modified reminders are left in the heap and skipped when they're popped, as removing from the middle of a heap is O(N).
 
         Performance characteristics:
         u -> Number of reminders each user has
         U -> Total number of users
-        N -> Total number of reminders in the system (not used)
+        N -> Total number of reminders in the system
+        k -> Number of expired reminders
 
-        set_reminder: O(log u)
+        set_reminder: O(u + log N)
         list_remindrs: O(u)
-        modify_reminder: O(log u)
-        delete_reminder: O(log u)
-        check_reminders: O(U)
+        has_reminder: O(1)
+        modify_reminder: O(u + log N)
+        delete_reminder: O(u)
+        get_expired_reminders: O(k log N)
+        restore_reminders: O(N)
+
+        If a `store` is passed in, every change is written through to it.
         """
-        self.reminders: defaultdict[User | Member, SortedSet] = defaultdict(
-            lambda: SortedSet()
+        self.store = store
+        # Keyed by the user's ID, hashing an int is cheaper than going through `User.__hash__`,
+        # and the `User`/`Member` objects we get from different interactions all share it
+        self.reminders: defaultdict[int, list[Reminder]] = defaultdict(list)
+        # The same reminders as a set, so membership checks don't have to scan the sorted list
+        self._reminder_sets: defaultdict[int, set[Reminder]] = defaultdict(set)
+
+        # `(timestamp, tie_breaker, user, reminder)`, the counter makes sure we never have to compare two users
+        # POSIX timestamps are plain floats, so comparing them with `time.time()` is a lot cheaper than comparing datetimes
+        self._heap: list[tuple[float, int, User | Member, Reminder]] = []
+        self._counter = count()
+
+        # Set whenever a new reminder is added, so `wait_for_next_reminder` can wake up and re-plan
+        self._updated = asyncio.Event()
+
+        # Search keys of each user's reminders in order, built on the first autocomplete after any change
+        self._search_keys: dict[int, list[str]] = {}
+
+    def _push(self, user: User | Member, reminder: Reminder) -> None:
+        """Adds the reminder to the heap, and wakes up anyone waiting for the next reminder"""
+        heapq.heappush(
+            self._heap, (reminder.timestamp, next(self._counter), user, reminder)
         )
+        self._updated.set()
 
-    def list_reminders(self, user: User | Member) -> SortedSet | None:
+    def list_reminders(self, user: User | Member) -> list[Reminder] | None:
         """
         Gets all the reminders for a user.
 
@@ -71,7 +229,30 @@ class ReminderManager:
         u -> number of reminders of a user
         O(u): As it gets **all** of the reminders of the user
         """
-        return self.reminders.get(user)
+        return self.reminders.get(user.id)
+
+    def has_reminder(self, user: User | Member, reminder: Reminder) -> bool:
+        """
+        Checks if the user has the reminder.
+
+        Performance characteristics:
+        O(1): A hash lookup in the user's set of reminders
+        """
+        # Use `get` so we don't create empty sets for users without any reminders
+        return reminder in self._reminder_sets.get(user.id, ())
+
+    def get_search_keys(self, user: User | Member) -> list[str]:
+        """
+        Gets the search keys of a user's reminders, in the same order as `list_reminders`.
+
+        Performance characteristics:
+        u -> number of reminders of a user
+        O(1): Unless the user's reminders changed since the last call, then O(u) to rebuild them
+        """
+        if (search_keys := self._search_keys.get(user.id)) is None:
+            search_keys = [reminder.search_key for reminder in self.reminders[user.id]]
+            self._search_keys[user.id] = search_keys
+        return search_keys
 
     def set_reminder(self, user: User | Member, dt: datetime, message: str) -> None:
         """
@@ -79,15 +260,23 @@ class ReminderManager:
 
         Performance characteristics:
         u -> number of reminders of a user.
-        O(log u) -> We only need to do a binary search to insert the reminder in the right position.
+        O(u) -> A hash membership check, then a binary search to insert the reminder in the right position.
         """
         reminder = Reminder(dt, message)
+        # Look the user's reminders up once, instead of on every use
+        bucket = self.reminders[user.id]
+        bucket_set = self._reminder_sets[user.id]
 
-        # Constant time as it's a sorted set.
-        if reminder in self.reminders[user]:
+        if reminder in bucket_set:
             raise ValueError("The reminder already exists")
 
-        self.reminders[user].add(Reminder(dt, message))
+        bisect.insort(bucket, reminder)
+        bucket_set.add(reminder)
+        self._search_keys.pop(user.id, None)
+        self._push(user, reminder)
+
+        if self.store:
+            self.store.add(user.id, reminder)
 
     def modify_reminder(
         self,
@@ -105,7 +294,7 @@ class ReminderManager:
 
         Performance characteristics:
         u -> number of reminders of a user.
-        O(log u) -> We only need to do 2 binary searches to remove the old reminder and insert the new one
+        O(u) -> A linear search to remove the old reminder, and a binary search to insert the new one
         """
         if not message and not dt:
             raise ValueError("At least datetime or message should be present")
@@ -113,14 +302,26 @@ class ReminderManager:
         dt = dt if dt else old_reminder.dt
 
         new_reminder = Reminder(dt, message)
+        bucket = self.reminders[user.id]
+        bucket_set = self._reminder_sets[user.id]
 
-        if new_reminder in self.reminders[user]:
+        if new_reminder in bucket_set:
             raise ValueError(
                 "You can't edit a reminder to make it the same as another reminder"
             )
 
-        self.reminders[user].remove(old_reminder)
-        self.reminders[user].add(Reminder(dt, message))
+        bucket.remove(old_reminder)
+        bisect.insort(bucket, new_reminder)
+        bucket_set.discard(old_reminder)
+        bucket_set.add(new_reminder)
+        self._search_keys.pop(user.id, None)
+
+        # The old reminder stays in the heap, it'll be skipped as it's no longer in the user's list
+        self._push(user, new_reminder)
+
+        if self.store:
+            self.store.remove(user.id, old_reminder)
+            self.store.add(user.id, new_reminder)
 
     def delete_reminder(self, user: User | Member, reminder: Reminder) -> None:
         """
@@ -128,71 +329,183 @@ class ReminderManager:
 
         Performance characteristics:
         u -> number of reminders of a user.
-        O(log u) -> We only need to do a binary search to remove the old reminder.
+        O(u) -> A linear search to remove the old reminder.
         """
-        self.reminders[user].remove(reminder)
+        bucket = self.reminders[user.id]
+        bucket.remove(reminder)
+        self._reminder_sets[user.id].discard(reminder)
+        self._search_keys.pop(user.id, None)
+
+        if not bucket:
+            del self.reminders[user.id]
+            del self._reminder_sets[user.id]
 
-        if not self.reminders[user]:
-            del self.reminders[user]
+        if self.store:
+            self.store.remove(user.id, reminder)
+
+    def restore_reminders(
+        self, reminders: Iterable[tuple[User | Member, list[Reminder]]]
+    ) -> None:
+        """
+        Adds back reminders loaded from the store, without writing them to it again.
+
+        Performance characteristics:
+        N -> Total number of reminders in the system.
+        O(N): The loaded lists are already sorted, and the heap is built in one go instead of pushing every reminder.
+        """
+        for user, user_reminders in reminders:
+            bucket = self.reminders[user.id]
+            bucket_set = self._reminder_sets[user.id]
+            for reminder in user_reminders:
+                if reminder not in bucket_set:
+                    bucket.append(reminder)
+                    bucket_set.add(reminder)
+                    self._heap.append(
+                        (reminder.timestamp, next(self._counter), user, reminder)
+                    )
+
+            # Reminders set while we were loading get merged in, sorting mostly sorted lists is linear
+            bucket.sort()
+            self._search_keys.pop(user.id, None)
+
+        heapq.heapify(self._heap)
+        self._updated.set()
 
     def get_expired_reminders(self) -> list[tuple[User | Member, Reminder]]:
         """
-        Loop through every user and get the expired reminders from the beginning of the set.
+        Pop the expired reminders off the top of the heap, skipping the ones that were deleted or modified.
 
         Performance characteristics:
-        U -> Total number of users.
-        O(U): As we're looping through all users and geting the first few expired reminders from them.
+        N -> Total number of reminders in the system.
+        k -> Number of expired reminders.
+        O(k log N): As we only pop the reminders that have expired, the rest of the heap is never looked at.
         """
         expired_reminders = []
-        for user, reminders in self.reminders.items():
-            for reminder in reminders:
-                if reminder.dt < datetime.now():
-                    expired_reminders.append((user, reminder))
-                else:
-                    # Since the reminders are sorted, we can break as soon as we don't find a expired reminder
-                    break
-
-        logger.debug(f"{expired_reminders = }")
+        # A reminder that was deleted and then set again has two entries in the heap, don't send it twice
+        seen: set[tuple[int, Reminder]] = set()
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, user, reminder = heapq.heappop(self._heap)
+
+            if self.has_reminder(user, reminder) and (user.id, reminder) not in seen:
+                seen.add((user.id, reminder))
+                expired_reminders.append((user, reminder))
+
+        # Let loguru format the message, so it isn't built on every tick when debug logs are off
+        logger.debug("expired_reminders = {!r}", expired_reminders)
         return expired_reminders
 
+    async def wait_for_next_reminder(self) -> None:
+        """Sleeps until the earliest reminder is due, or until a new reminder is added."""
+        timeout: float = MAX_CHECKING_INTERVAL
+        if self._heap:
+            seconds_left = self._heap[0][0] - time.time()
+            timeout = min(max(0, seconds_left), MAX_CHECKING_INTERVAL)
+
+        self._updated.clear()
+        try:
+            await asyncio.wait_for(self._updated.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+
     def get_reminder(self, user: User | Member, reminder_index: int) -> Reminder:
         """Helper function for upstream code to get the `Reminder` object from an index value"""
-        return cast(Reminder, self.reminders[user][reminder_index])
+        return self.reminders[user.id][reminder_index]
 
 
 class RemindCommand(commands.GroupCog, group_name="reminders"):  # type: ignore[call-arg]
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.reminder_manager = ReminderManager()
+        self.reminder_manager = ReminderManager(ReminderStore(REMINDERS_DB))
+
+        # DM channels of the users we've reminded before, so we don't have to create them again
+        self._dm_cache: dict[int, discord.DMChannel] = {}
 
         # Create a background task to check the reminders
         self.bot.loop.create_task(self.check_reminders())
 
     async def check_reminders(self) -> None:
-        """Checks for expired reminders every `CHECKING_FREQUENCY` seconds."""
+        """Checks for expired reminders whenever the next reminder is due."""
         await self.bot.wait_until_ready()
+        await self.restore_reminders()
 
         while not self.bot.is_closed():
             logger.debug("Checking reminders...")
 
-            for user, reminder in self.reminder_manager.get_expired_reminders():
-                if not (channel := user.dm_channel):
-                    channel = await user.create_dm()
+            # Send all the expired reminders at once, instead of waiting for each DM to go through
+            await asyncio.gather(
+                *(
+                    self._dispatch(user, reminder)
+                    for user, reminder in self.reminder_manager.get_expired_reminders()
+                ),
+                return_exceptions=True,
+            )
 
-                embed = GDSCEmbed(
-                    self.bot,
-                    description=f"On <t:{int(reminder.dt.timestamp())}> you asked me to remind you about: {reminder.message}",
-                )
+            await self.reminder_manager.wait_for_next_reminder()
 
-                # If the user is from a guild then set the thumbnail as the guild icon
-                if isinstance(user, Member):
-                    if user.guild.icon:
-                        embed.set_thumbnail(url=user.guild.icon.url)
-                await channel.send(embed=embed)
+    async def restore_reminders(self) -> None:
+        """Loads the saved reminders back, reminders that expired while the bot was down are sent right away"""
+        store = self.reminder_manager.store
+        if not store:
+            return
 
-                self.reminder_manager.delete_reminder(user, reminder)
+        saved_reminders = store.load()
+        # Resolve every user at once, instead of waiting a round trip for each one that isn't cached
+        users = await asyncio.gather(
+            *(self._resolve_user(user_id) for user_id in saved_reminders),
+            return_exceptions=True,
+        )
+
+        restored = []
+        for (user_id, reminders), user in zip(saved_reminders.items(), users):
+            if isinstance(user, discord.NotFound):
+                # The account is gone, so its reminders can never be sent
+                logger.info(f"Deleting reminders of unknown user {user_id}")
+                store.remove_user(user_id)
+            elif isinstance(user, BaseException):
+                logger.error(f"Unable to restore reminders of {user_id}: {user}")
+            else:
+                restored.append((user, reminders))
+
+        self.reminder_manager.restore_reminders(restored)
+        logger.info(f"Restored reminders of {len(restored)} users")
 
-            await asyncio.sleep(CHECKING_FREQUENCY)
+    async def _resolve_user(self, user_id: int) -> User:
+        """Gets the user from the cache, or fetches them from discord if they aren't in it"""
+        return self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+
+    async def cog_unload(self) -> None:
+        if self.reminder_manager.store:
+            self.reminder_manager.store.close()
+
+    async def _dispatch(self, user: User | Member, reminder: Reminder) -> None:
+        """DMs the user about their reminder, then deletes it"""
+        try:
+            channel = (
+                self._dm_cache.get(user.id) or user.dm_channel or await user.create_dm()
+            )
+            self._dm_cache[user.id] = channel
+
+            embed = GDSCEmbed(
+                self.bot,
+                description=f"On <t:{int(reminder.timestamp)}> you asked me to remind you about: {reminder.message}",
+            )
+
+            # If the user is from a guild then set the thumbnail as the guild icon
+            if isinstance(user, Member):
+                if user.guild.icon:
+                    embed.set_thumbnail(url=user.guild.icon.url)
+            await channel.send(embed=embed)
+        except discord.Forbidden:
+            # The user has blocked the bot or closed their DMs
+            logger.error(f"Unable to DM {user} about their reminder")
+        except discord.HTTPException as e:
+            logger.error(f"Failed to send reminder to {user}: {e}")
+        finally:
+            # The reminder is already off the schedule, so delete it even if sending failed
+            # The user may have deleted it themselves while we were sending it
+            if self.reminder_manager.has_reminder(user, reminder):
+                self.reminder_manager.delete_reminder(user, reminder)
 
     async def reminder_autocomplete(
         self, interaction: discord.Interaction, current: str
@@ -200,53 +513,91 @@ class RemindCommand(commands.GroupCog, group_name="reminders"):  # type: ignore[
         """
         Provides auto completion for reminder slash commands
 
-        If no `current` input is present then show all the reminders with their timestamp.
-        Otherwise use `rapidfuzz` to fuzzy search the top 5 best reminder matches accoring to the reminder message
-        and show that.
+        If no `current` input is present then show the earliest reminders with their timestamp.
+        Otherwise show the reminders containing the input first,
+        then use `rapidfuzz` to fill the top 5 with the best fuzzy matches accoring to the reminder message.
 
         Returns the reminder
         """
         reminders = self.reminder_manager.list_reminders(interaction.user)
         if not reminders:
             return []
-        if not current:  # If no input, return all reminders
+        if not current:  # If no input, return all reminders that discord can show
             return [
                 app_commands.Choice(
-                    name=f"{reminder.message} at {reminder.dt.strftime(DATE_TIME_FORMAT)}",
+                    name=f"{reminder.message} at {reminder.formatted_dt}",
                     value=i,
                 )
-                # Show all the reminders from the earliest to the latest
-                for i, reminder in enumerate(reminders)
+                # Show the reminders from the earliest to the latest
+                for i, reminder in islice(
+                    enumerate(reminders), MAX_AUTOCOMPLETE_CHOICES
+                )
             ]
 
-        # Create a dictionary mapping messages to their index
-        message_index_map = {
-            f"{reminder.message}: {reminder.dt.strftime(DATE_TIME_FORMAT)}": reminder
-            for reminder in reminders
-        }
+        # The search keys are already normalized, so only the user's input needs processing
+        query = default_process(current)
+        search_keys = self.reminder_manager.get_search_keys(interaction.user)
+
+        # Usually the user is typing out part of a reminder, the reminders containing it are always the best matches
+        indices = list(
+            islice(
+                (i for i, search_key in enumerate(search_keys) if query in search_key),
+                AUTOCOMPLETE_MATCHES,
+            )
+        )
+
+        # If there aren't enough of them, fill the rest of the suggestions with fuzzy matches
+        if len(indices) < AUTOCOMPLETE_MATCHES:
+            # The cutoff lets rapidfuzz give up early on reminders that can't be a good match
+            # Passing a list makes rapidfuzz return the index of each match, which is the index of the reminder
+            # Ask for enough matches to still fill the suggestions after skipping the ones we already have
+            def extract() -> list[tuple[str, float, int]]:
+                return process.extract(
+                    query,
+                    search_keys,
+                    scorer=fuzz.WRatio,
+                    processor=None,
+                    score_cutoff=AUTOCOMPLETE_SCORE_CUTOFF,
+                    limit=AUTOCOMPLETE_MATCHES + len(indices),
+                )
+
+            threaded = len(search_keys) > AUTOCOMPLETE_THREAD_THRESHOLD
+            matches = await asyncio.to_thread(extract) if threaded else extract()
+
+            found = set(indices)
+            indices += [i for (_, _, i) in matches if i not in found][
+                : AUTOCOMPLETE_MATCHES - len(indices)
+            ]
 
-        # Perform fuzzy matching
-        matches = process.extract(current, message_index_map.keys(), limit=5)
+            if threaded:
+                # The reminders may have changed while we were waiting,
+                # only keep the ones that are still at the same index
+                reminders = self.reminder_manager.list_reminders(interaction.user) or []
+                indices = [
+                    i
+                    for i in indices
+                    if i < len(reminders) and reminders[i].search_key == search_keys[i]
+                ]
 
         return [
             app_commands.Choice(
-                name=f"{match} at {message_index_map[match].dt.strftime(DATE_TIME_FORMAT)}",
-                value=reminders.index(message_index_map[match]),
+                name=f"{reminders[i].message} at {reminders[i].formatted_dt}",
+                value=i,
             )
-            for (match, _, _) in matches
+            for i in indices
         ]
 
     def __calculate_datetime(self, time: str, day: Optional[str] = None) -> datetime:
-        # Get the initial date setup from the `time`
-        dt = datetime.strptime(time, TIME_FORMAT)
+        # Get the initial time setup from the `time`
+        hour, minute = parse_time(time)
         now = datetime.now()
 
-        # If the day was passed in combine it with the initial dt
+        # If the day was passed in combine it with the time
         if day:
-            dt = datetime.combine(datetime.strptime(day, DATE_FORMAT), dt.time())
+            dt = parse_date(day).replace(hour=hour, minute=minute)
         else:
             # If no day was passed in consider it to be today
-            dt = datetime.combine(now.date(), dt.time())
+            dt = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
             # If the time has already passed today, set it for tomorrow
             if dt < now:
@@ -259,7 +610,7 @@ class RemindCommand(commands.GroupCog, group_name="reminders"):  # type: ignore[
             if dt.time() < now.time():
                 raise PastDateTimeError(message="The time passed in is already over")
 
-        logger.debug(f"Calculated date time: {dt}")
+        logger.debug("Calculated date time: {}", dt)
         return dt
 
     @app_commands.command(name="set", description="Set a reminder!")
@@ -313,7 +664,7 @@ class RemindCommand(commands.GroupCog, group_name="reminders"):  # type: ignore[
             return
 
         reminders_str = "\n".join(
-            f"{i}. <t:{int(reminder.dt.timestamp())}>: {reminder.message}"
+            f"{i}. <t:{int(reminder.timestamp)}>: {reminder.message}"
             for i, reminder in enumerate(reminders, start=1)
         )
 
@@ -346,76 +697,57 @@ class RemindCommand(commands.GroupCog, group_name="reminders"):  # type: ignore[
 
         Then the future time is calculated, the old reminder is deleted and the new reminder is added.
         """
-        old_reminder_val = self.reminder_manager.get_reminder(
-            interaction.user, old_reminder
-        )
+        logger.info(f"User {interaction.user} used /modifyreminder")
 
         if not message and not time and not day:
-            error_embed = ErrorEmbed(
-                self.bot, description="Reminder unmodified, it stays the same"
+            await self._respond_error(
+                interaction, "Reminder unmodified, it stays the same"
             )
-            await interaction.response.send_message(embed=error_embed, ephemeral=True)
             return
 
-        if message and not time and not day:
+        old_reminder_val = self.reminder_manager.get_reminder(
+            interaction.user, old_reminder
+        )
+
+        # Only calculate a new datetime if the time or the day was changed
+        dt = None
+        if time or day:
             try:
-                self.reminder_manager.modify_reminder(
-                    interaction.user, old_reminder_val, message=message
-                )
-                await interaction.response.send_message(
-                    embed=SuccessEmbed(
-                        self.bot, description="Reminder message changed!"
-                    ),
-                    ephemeral=True,
-                )
-            except ValueError as e:
-                error_embed = ErrorEmbed(self.bot, description=f"{e}")
-                await interaction.response.send_message(
-                    embed=error_embed, ephemeral=True
+                dt = self.__calculate_datetime(
+                    time or old_reminder_val.dt.time().strftime(TIME_FORMAT), day
                 )
-            return
+            except (ValueError, PastDateTimeError) as e:
+                await self._respond_error(interaction, f"Invalid time: {e}")
+                logger.error(f"{e}")
+                return
 
-        if not message and not (time or day):
-            await interaction.response.send_message(
-                embed=ErrorEmbed(
-                    self.bot,
-                    description="You have to specify either the time or the day or the message",
-                ),
-                ephemeral=True,
+        try:
+            self.reminder_manager.modify_reminder(
+                interaction.user, old_reminder_val, dt, message
             )
+        except ValueError as e:
+            await self._respond_error(interaction, f"{e}")
             return
 
-        logger.info(f"User {interaction.user} used /modifyreminder")
-
-        try:
-            if time:
-                dt = self.__calculate_datetime(time, day)
-            else:
-                dt = self.__calculate_datetime(
-                    time=old_reminder_val.dt.time().strftime(TIME_FORMAT), day=day
-                )
+        await interaction.response.send_message(
+            embed=SuccessEmbed(
+                self.bot,
+                description=(
+                    "Reminder modified successfully!"
+                    if dt
+                    else "Reminder message changed!"
+                ),
+            ),
+            ephemeral=True,
+        )
 
-            try:
-                self.reminder_manager.modify_reminder(
-                    interaction.user, old_reminder_val, dt, message
-                )
-                await interaction.response.send_message(
-                    embed=SuccessEmbed(
-                        self.bot, description="Reminder modified successfully!"
-                    ),
-                    ephemeral=True,
-                )
-            except ValueError as e:
-                await interaction.response.send_message(
-                    embed=ErrorEmbed(self.bot, description=f"{e}"), ephemeral=True
-                )
-                return
-        except (ValueError, PastDateTimeError) as e:
-            await interaction.response.send_message(
-                embed=ErrorEmbed(self.bot, description=f"Invalid time: {e}"),
-                ephemeral=True,
-            )
-            logger.error(f"{e}")
+    async def _respond_error(
+        self, interaction: discord.Interaction, message: str
+    ) -> None:
+        """Responds to the user with an ephemeral error embed"""
+        await interaction.response.send_message(
+            embed=ErrorEmbed(self.bot, description=message), ephemeral=True
+        )
 
     @app_commands.command(name="delete", description="Delete a reminder!")
     @app_commands.describe(
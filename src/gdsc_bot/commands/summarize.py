@@ -1,81 +1,62 @@
-import os
-
 import discord
 from discord import app_commands
 from discord.ext import commands
 from google import genai
 from loguru import logger
 
+from gdsc_bot.util import GEMINI_API_KEY, send_streamed
 
-@app_commands.context_menu(name="Summarize")
-async def summarize(interaction: discord.Interaction, message: discord.Message) -> None:
-    """Provides a context menu option fo the user to summarize long messages.
-
-    Basically the same as `respond.py` except with the additional summarize prompt
-    """
-    await (
-        interaction.response.defer()
-    )  # Defer response as the Gemini API call takes time
-
-    # Load the API key
-    genai_key = os.getenv("GEMINI_API_KEY")
 
-    if not genai_key:
-        logger.error("Unable to road gemini api key")
+class SummarizeCommand(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        # Create the Gemini client once, so every summary reuses its connections
+        self.genai_client = genai.Client(api_key=GEMINI_API_KEY)
+        self.bot = bot
 
-    # Make the gemini client
-    genai_client = genai.Client(api_key=genai_key)
-
-    try:
-        # Call the API to get the response for the user's prompt
-        response = genai_client.models.generate_content(
-            model="gemini-2.0-flash",
-            contents=f"Summraize the following message: \n{message.content}",
+        # Context menus can't be declared inside a cog with the decorator, so register it by hand
+        self.summarize_menu = app_commands.ContextMenu(
+            name="Summarize", callback=self.summarize
         )
+        self.bot.tree.add_command(self.summarize_menu)
 
-        if not response:
-            await interaction.followup.send("No response")
-            return
-
-        text = response.text
-        if not text:
-            logger.debug("No response from gemini")
-            return
+    async def cog_unload(self) -> None:
+        self.bot.tree.remove_command(
+            self.summarize_menu.name, type=self.summarize_menu.type
+        )
 
-        # HACK: Since discord has a 2000 characters limit, therefore split it into chunks
-        if len(text) <= 2000:
-            await interaction.followup.send(text)
-        else:
-            chuncks = []
-            current_chunk = ""
+    async def summarize(
+        self, interaction: discord.Interaction, message: discord.Message
+    ) -> None:
+        """Provides a context menu option fo the user to summarize long messages.
 
-            for line in text.splitlines():
-                # If we can't fit any more lines into the current chunk
-                # Then add the current chunk to the chunks list (as it's over)
-                #
-                # Start the next current chunk with the unadded line
-                if len(current_chunk) + len(line) + 1 > 2000:
-                    chuncks.append(current_chunk)
-                    current_chunk = line  # Start a new chunk
-                else:
-                    # Else append the current line to the current chunk
-                    # or just the current line if it's empty
-                    current_chunk += ("\n" + line) if current_chunk else line
+        Basically the same as `respond.py` except with the additional summarize prompt
+        """
+        await (
+            interaction.response.defer()
+        )  # Defer response as the Gemini API call takes time
 
-            if current_chunk:
-                chuncks.append(current_chunk)
+        try:
+            # Call the API to get the response for the user's prompt
+            # Stream the response with the async client, so the event loop keeps running
+            # and the first messages go out while Gemini is still writing the rest
+            stream = await self.genai_client.aio.models.generate_content_stream(
+                model="gemini-2.0-flash",
+                contents=f"Summraize the following message: \n{message.content}",
+            )
 
-            for chunk in chuncks:
-                await interaction.followup.send(chunk)
+            if not await send_streamed(interaction, stream):
+                return
 
-        logger.info(f"User {interaction.user} used /respond with message: {message}")
+            logger.info(
+                f"User {interaction.user} used /respond with message: {message}"
+            )
 
-    # Blanket `Exception` is bad I know, but the user doesn't need to know which error occured.
-    # So just log it instead
-    except Exception as e:
-        logger.error(f"Error in /respond: {e}")
-        await interaction.followup.send("An error occurred. Please try again.")
+        # Blanket `Exception` is bad I know, but the user doesn't need to know which error occured.
+        # So just log it instead
+        except Exception as e:
+            logger.error(f"Error in /respond: {e}")
+            await interaction.followup.send("An error occurred. Please try again.")
 
 
 async def setup(bot: commands.Bot) -> None:
-    bot.tree.add_command(summarize)
+    await bot.add_cog(SummarizeCommand(bot))
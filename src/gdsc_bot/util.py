@@ -0,0 +1,104 @@
+import os
+import textwrap
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Final
+
+import discord
+from google.genai import types
+from loguru import logger
+
+# Load the API key once, when the first Gemini command gets loaded
+GEMINI_API_KEY: Final = os.getenv("GEMINI_API_KEY")
+
+if not GEMINI_API_KEY:
+    logger.error("Unable to load Gemini API key")
+
+# Discord doesn't allow messages longer than this
+DISCORD_MESSAGE_LIMIT = 2000
+
+
+def _fit_line(line: str, limit: int) -> list[str]:
+    """Wraps a line that's too long for a single message, breaking it on whitespace where possible"""
+    if len(line) <= limit:
+        return [line]
+    # Keep every character, so joining the pieces gives back the exact line
+    return textwrap.wrap(
+        line,
+        limit,
+        expand_tabs=False,
+        replace_whitespace=False,
+        drop_whitespace=False,
+    )
+
+
+async def _lines(pieces: AsyncIterable[str], limit: int) -> AsyncIterator[str]:
+    """Yields the lines of streamed text as soon as each of them ends, none of them longer than `limit`"""
+    # The last line, until we know it has ended
+    partial = ""
+    async for piece in pieces:
+        *lines, partial = (partial + piece).split("\n")
+        for line in lines:
+            for fitted_line in _fit_line(line, limit):
+                yield fitted_line
+
+        # Don't let a very long line pile up, send the parts of it that are already complete
+        if len(partial) > limit:
+            *fitted_lines, partial = _fit_line(partial, limit)
+            for fitted_line in fitted_lines:
+                yield fitted_line
+
+    for fitted_line in _fit_line(partial, limit):
+        yield fitted_line
+
+
+async def chunk_for_discord(
+    pieces: AsyncIterable[str], limit: int = DISCORD_MESSAGE_LIMIT
+) -> AsyncIterator[str]:
+    """
+    Regroups streamed text into chunks that fit in a discord message, splitting between lines where possible.
+
+    The lines of each chunk are collected in a list and joined once, instead of growing a string line by line.
+    Chunks that are only whitespace are skipped, as discord refuses to send them.
+    """
+    current_lines: list[str] = []
+    # Length of the current chunk, including a newline after every line
+    current_length = 0
+
+    async for line in _lines(pieces, limit):
+        if current_lines and current_length + len(line) > limit:
+            chunk = "\n".join(current_lines)
+            if chunk.strip():
+                yield chunk
+            current_lines = []
+            current_length = 0
+
+        current_lines.append(line)
+        current_length += len(line) + 1
+
+    chunk = "\n".join(current_lines)
+    if chunk.strip():
+        yield chunk
+
+
+async def send_streamed(
+    interaction: discord.Interaction,
+    stream: AsyncIterator[types.GenerateContentResponse],
+) -> list[str]:
+    """
+    Sends a streamed Gemini response as followups, each chunk as soon as it's complete.
+
+    Replies with "No response" if Gemini didn't send any text.
+    Returns the chunks that were sent.
+    """
+    chunks = []
+    async for chunk in chunk_for_discord(
+        response.text async for response in stream if response.text
+    ):
+        await interaction.followup.send(chunk)
+        chunks.append(chunk)
+
+    if not chunks:
+        logger.debug("No response from Gemini")
+        await interaction.followup.send("No response")
+
+    return chunks